@@ -6,44 +6,100 @@ import signal
 from sys import platform
 
 import time
-from concurrent.futures import ProcessPoolExecutor
 
 from teletask.core import TelegramQueue
 from teletask.devices import Devices
 from teletask.io import TeletaskDoIPInterface
 from teletask.doip import Telegram, TeletaskConst, TelegramCommand, TelegramFunction, TelegramSetting, TelegramHeartbeat
 
+# The LOG registration telegrams are immutable and identical on every start,
+# so they are built once and reused across register_feedback calls.
+_FEEDBACK_LOG_TELEGRAMS = {
+    function: Telegram(command=TelegramCommand.LOG, function=function)
+    for function in (
+        TelegramFunction.RELAY,
+        TelegramFunction.DIMMER,
+        TelegramFunction.LOCMOOD,
+        TelegramFunction.GENMOOD,
+        TelegramFunction.FLAG,
+    )
+}
+
+
+def _install_uvloop():
+    """Install uvloop as the event loop policy if it is available.
+
+    uvloop is a soft-optional dependency: when installed it runs the same
+    async code with a libuv-backed loop and noticeably lower per-callback
+    overhead. Silently keep the default loop otherwise.
+    """
+    if platform == "win32":
+        return
+    if type(asyncio.get_event_loop_policy()).__module__.startswith("uvloop"):
+        return  # uvloop is already installed
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 class Teletask:
     """Class for reading and writing Teletask/DoIP packets."""
     DEFAULT_ADDRESS = ''
+    FLUSH_WINDOW = 0.002  # Seconds outgoing telegrams are coalesced before flushing
 
-    def __init__(self, config=None, loop=None, telegram_received_cb=None):
+    def __init__(self, config=None, loop=None, telegram_received_cb=None, telegram_queue_maxsize=1024):
         """Initialize Teletask class.
-        
+
         Args:
             config: Optional configuration for the Teletask module.
             loop: An optional event loop to run asynchronous tasks.
             telegram_received_cb: Optional callback function to handle received telegrams.
+            telegram_queue_maxsize: Upper bound of queued telegrams; producers block
+                (await) when it is reached so a stalled connection cannot grow the
+                queue without limit.
         """
+        self.logger = logging.getLogger('teletask.log')  # Logger for general logging.
+        self.teletask_logger = logging.getLogger('teletask.teletask')  # Logger for Teletask-specific logs.
+        self.telegram_logger = logging.getLogger('teletask.telegram')  # Logger for telegram-related logs.
         self.devices = Devices()  # Instance to manage connected devices.
-        self.telegrams = asyncio.Queue()  # Asynchronous queue for handling telegrams.
+        self.telegrams = asyncio.Queue(maxsize=telegram_queue_maxsize)  # Bounded telegram queue.
+        if loop is None:
+            _install_uvloop()  # Prefer the faster libuv event loop when available.
         self.loop = loop or asyncio.get_event_loop()  # Use the provided loop or get the current running loop.
         self.sigint_received = asyncio.Event()  # Event to signal when termination is received.
         self.telegram_queue = TelegramQueue(self)  # Queue for processing telegrams.
         self.state_updater = None  # Placeholder for a state updater, if needed.
         self.teletaskip_interface = None  # Placeholder for the Teletask DoIP interface.
         self.started = False  # Flag to indicate if the module is started.
-        self.executors = ProcessPoolExecutor(2)  # Executor for handling CPU-bound tasks.
+        self._executors = None  # Executor for CPU-bound tasks, created lazily on first use.
+        self._pending_telegrams = []  # Outgoing telegrams awaiting the next coalesced flush.
+        self._flush_handle = None  # TimerHandle for the scheduled flush, if any.
+        self._rv_by_ga = {}  # Remote values indexed by group address for O(1) dispatch.
+        self._updates_pending = set()  # Remote values with a callback waiting to fire.
+        self._updates_event = asyncio.Event()  # Wakes the update supervisor once per burst.
+        self._updates_task = None  # Supervisor task draining the pending updates.
         self.registered_devices = {}  # Dictionary to store registered devices by component type.
-        self.logger = logging.getLogger('teletask.log')  # Logger for general logging.
-        self.teletask_logger = logging.getLogger('teletask.teletask')  # Logger for Teletask-specific logs.
-        self.telegram_logger = logging.getLogger('teletask.telegram')  # Logger for telegram-related logs.
 
         self.logger.info("Teletask instance created.")
 
         if telegram_received_cb is not None:
             self.telegram_queue.register_telegram_received_cb(telegram_received_cb)
 
+    @property
+    def executors(self):
+        """Return the process pool executor, creating it on first access.
+
+        Forking worker processes at construction time costs startup latency
+        and memory even when nothing is ever submitted, so the pool is only
+        materialized when actually needed.
+        """
+        if self._executors is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executors = ProcessPoolExecutor(max_workers=2)
+        return self._executors
+
     def __del__(self):
         """Destructor. Cleaning up if this was not done before."""
         if self.started:
@@ -70,8 +126,74 @@ class Teletask:
 
         self.started = True  # Set the module state to started.
 
+    def queue_telegram(self, telegram):
+        """Queue an outgoing telegram through the coalescing buffer.
+
+        Telegrams produced within the flush window are handed to the telegram
+        queue as one list, so a burst of device commands costs a single queue
+        put and event-loop wake-up instead of one per telegram.
+
+        Args:
+            telegram: The telegram to queue for sending.
+        """
+        if not self._pending_telegrams and self.telegrams.empty():
+            # Writer is idle: send immediately and skip the queue round-trip.
+            interface = self.teletaskip_interface
+            if interface is not None and interface.write_buffer_empty():
+                try:
+                    interface.send_immediate(telegram)
+                    return
+                except OSError as ex:
+                    self.logger.warning("Immediate send failed, queueing instead: %s", ex)
+        self._pending_telegrams.append(telegram)
+        if self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(self.FLUSH_WINDOW, self._flush_pending)
+
+    def _flush_pending(self):
+        """Move the coalesced telegrams into the telegram queue as one item."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_telegrams:
+            return
+        pending, self._pending_telegrams = self._pending_telegrams, []
+        try:
+            self.telegrams.put_nowait(pending)
+        except asyncio.QueueFull:
+            # The queue is saturated; hand off asynchronously so nothing is lost.
+            self.loop.create_task(self.telegrams.put(pending))
+
+    def schedule_update(self, remote_value):
+        """Schedule a remote value's after_update callback for batched fan-out.
+
+        A burst of updates within one event-loop tick sets the event once and
+        resumes the supervisor once, instead of awaiting each callback inline.
+
+        Args:
+            remote_value: The RemoteValue whose callback should run.
+        """
+        self._updates_pending.add(remote_value)
+        self._updates_event.set()
+        if self._updates_task is None or self._updates_task.done():
+            self._updates_task = self.loop.create_task(self._dispatch_updates())
+
+    async def _dispatch_updates(self):
+        """Drain the pending update set and run the callbacks in one batch."""
+        while True:
+            await self._updates_event.wait()
+            self._updates_event.clear()
+            pending, self._updates_pending = self._updates_pending, set()
+            results = await asyncio.gather(
+                *(remote_value.after_update_cb() for remote_value in pending),
+                return_exceptions=True)
+            for remote_value, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    self.logger.warning("Update callback failed for %s: %s",
+                                        remote_value.device_name, result)
+
     async def join(self):
         """Wait until all telegrams were processed."""
+        self._flush_pending()  # Push out any coalesced telegrams first.
         await self.telegrams.join()  # Wait for the telegram queue to finish processing.
 
     async def _stop_teletaskip_interface_if_exists(self):
@@ -83,8 +205,14 @@ class Teletask:
     async def stop(self):
         """Stop Teletask module."""
         await self.join()  # Wait for all telegrams to be processed.
+        if self._updates_task is not None:
+            self._updates_task.cancel()  # Stop the update supervisor.
+            self._updates_task = None
         await self.telegram_queue.stop()  # Stop the telegram queue.
         await self._stop_teletaskip_interface_if_exists()  # Stop the DoIP interface.
+        if self._executors is not None:
+            self._executors.shutdown(wait=False)  # Only shut down if it was ever created.
+            self._executors = None
         self.started = False  # Set the module state to not started.
 
     async def loop_until_sigint(self):
@@ -96,45 +224,54 @@ class Teletask:
         if platform == "win32":
             self.logger.warning('Windows does not support signals')  # Warn if on Windows.
         else:
-            self.loop.add_signal_handler(signal.SIGINT, sigint_handler)  # Add signal handler for Ctrl+C.
+            try:
+                self.loop.add_signal_handler(signal.SIGINT, sigint_handler)  # Add signal handler for Ctrl+C.
+            except (ValueError, NotImplementedError) as ex:
+                # Raised when embedded in a host that owns the signal handling or
+                # when running outside the main thread; the host controls shutdown.
+                self.logger.info("No SIGINT handler installed: %s", ex)
 
         self.logger.warning('Press Ctrl+C to stop')  # Log instruction to the user.
         await self.sigint_received.wait()  # Wait for the termination signal.
 
     async def register_feedback(self):
-        """Register feedback for various device types."""
-        # Create and send telegrams for device registration.
-        telegram = Telegram(command=TelegramCommand.LOG, function=TelegramFunction.RELAY)
-        self.registered_devices["RELAY"] = {}
-        await self.telegrams.put(telegram)  # Put telegram in the queue.
-        await asyncio.sleep(1)  # Wait for a moment before the next registration.
-
-        telegram = Telegram(command=TelegramCommand.LOG, function=TelegramFunction.DIMMER)
-        self.registered_devices["DIMMER"] = {}
-        await self.telegrams.put(telegram)
-        await asyncio.sleep(1)
-
-        telegram = Telegram(command=TelegramCommand.LOG, function=TelegramFunction.LOCMOOD)
-        self.registered_devices["LOCMOOD"] = {}
-        await self.telegrams.put(telegram)
-        await asyncio.sleep(1)
-
-        telegram = Telegram(command=TelegramCommand.LOG, function=TelegramFunction.GENMOOD)
-        self.registered_devices["GENMOOD"] = {}
-        await self.telegrams.put(telegram)
-        await asyncio.sleep(1)
-
-        telegram = Telegram(command=TelegramCommand.LOG, function=TelegramFunction.FLAG)
-        self.registered_devices["FLAG"] = {}
-        await self.telegrams.put(telegram)
-        await asyncio.sleep(1)
+        """Register feedback for various device types.
+
+        Enqueues the LOG telegrams back-to-back instead of sleeping a second
+        between each, so the queue can start draining immediately.
+        """
+        for function, telegram in _FEEDBACK_LOG_TELEGRAMS.items():
+            self.registered_devices[function.name] = {}
+            self.queue_telegram(telegram)
+
+    def register_remote_value(self, group_address, remote_value):
+        """Register a remote value under its group address.
+
+        Keeps a hash index so incoming telegrams can be dispatched by address
+        lookup instead of scanning every device.
+
+        Args:
+            group_address: The integer group address of the remote value.
+            remote_value: The RemoteValue instance to register.
+        """
+        self._rv_by_ga.setdefault(int(group_address), []).append(remote_value)
+
+    def remote_values_by_group_address(self, group_address):
+        """Return the remote values registered under the given group address."""
+        return self._rv_by_ga.get(int(group_address), ())
 
     def register_device(self, device):
         """Register a device to the Teletask module.
-        
+
         Args:
             device: The device object to register.
         """
         if device.doip_component in self.registered_devices:
-            # Store the device in the registered_devices dictionary using its group address.
-            self.registered_devices[device.doip_component][device.switch.group_address] = device
\ No newline at end of file
+            remote = getattr(device, "switch", None) or getattr(device, "dimmer", None)
+            if remote is None or remote.group_address is None:
+                return
+            # Key by the raw integer address used on the wire; int keys hash
+            # without allocating, unlike a str() of the address per lookup.
+            group_address = remote.group_address
+            group_address = int(getattr(group_address, "value", group_address))
+            self.registered_devices[device.doip_component][group_address] = device
\ No newline at end of file
@@ -6,16 +6,34 @@ You may register callbacks to be notified when a telegram is pushed to the queue
 """
 
 import asyncio
-from teletask.doip import Telegram, TelegramFunction, TelegramHeartbeat
+import logging
+
+from teletask.doip import Frame, TelegramFunction, TelegramHeartbeat
 from teletask.exceptions import TeletaskException
 
+# Cache of TelegramFunction value -> name, so the hot receive path does not
+# construct an enum member per incoming telegram.
+_DOIP_NAME = {function.value: function.name for function in TelegramFunction}
+
+# The keep-alive telegram is parameter-free and immutable, so one shared
+# instance (and its encoded wire form) serves every heartbeat tick.
+_HEARTBEAT = TelegramHeartbeat()
+_HEARTBEAT_FRAME = _HEARTBEAT.to_bytes()
+
 
 class TelegramQueue:
     """Class for managing a telegram queue."""
 
+    MAX_BATCH = 64  # Upper bound of telegrams drained from the queue per wake-up
+    HEARTBEAT_INTERVAL = 10  # Seconds between keep-alive telegrams
+
+    __slots__ = ("teletask", "telegram_received_cbs", "queue_stopped", "_hb_handle", "_run_task", "_debug")
+
     class Callback:
         """Callback class for handling telegram received callbacks."""
-        
+
+        __slots__ = ("callback",)
+
         def __init__(self, callback):
             """Initialize Callback class."""
             self.callback = callback
@@ -23,50 +41,128 @@ class TelegramQueue:
     def __init__(self, teletask):
         """Initialize TelegramQueue class."""
         self.teletask = teletask
-        self.telegram_received_cbs = []  # List of callbacks for received telegrams
+        self.telegram_received_cbs = ()  # Immutable snapshot of callbacks, rebuilt on (un)register
         self.queue_stopped = asyncio.Event()  # Event to signal stopping the queue
+        self._hb_handle = None  # TimerHandle for the next scheduled heartbeat
+        self._run_task = None  # Reference to the processing task, kept so it cannot be GC'd
+        self._debug = teletask.logger.isEnabledFor(logging.DEBUG)  # Cached debug-level flag
+
+    def reset_log_level(self):
+        """Refresh the cached debug flag after the application changes log levels."""
+        self._debug = self.teletask.logger.isEnabledFor(logging.DEBUG)
 
     def register_telegram_received_cb(self, telegram_received_cb):
         """Register a callback for telegrams received from the Teletask bus."""
         callback = TelegramQueue.Callback(telegram_received_cb)
-        self.telegram_received_cbs.append(callback)  # Store the callback
+        self.telegram_received_cbs = self.telegram_received_cbs + (callback,)  # Copy-on-write
         return callback
 
     def unregister_telegram_received_cb(self, telegram_received_cb):
         """Unregister a callback for telegrams received from the Teletask bus."""
-        self.telegram_received_cbs.remove(telegram_received_cb)  # Remove the callback
+        self.telegram_received_cbs = tuple(
+            callback for callback in self.telegram_received_cbs if callback is not telegram_received_cb)
 
     async def start(self):
         """Start the telegram queue."""
-        self.teletask.loop.create_task(self.run())  # Run the telegram processing loop
-        asyncio.ensure_future(self.start_heartbeat())  # Start heartbeat task
+        # Keep a reference: untracked tasks may be garbage-collected mid-flight
+        self._run_task = self.teletask.loop.create_task(self.run())
+        self._tick_heartbeat()  # Enqueue the first heartbeat and schedule the next one
 
-    async def start_heartbeat(self):
-        """Send periodic heartbeat telegrams."""
-        while True:
-            telegram = TelegramHeartbeat()  # Create a heartbeat telegram
-            await self.teletask.telegrams.put(telegram)  # Queue the heartbeat telegram
-            await asyncio.sleep(10)  # Wait for 10 seconds before sending the next heartbeat
+    def _tick_heartbeat(self):
+        """Enqueue a heartbeat telegram and reschedule the next tick.
+
+        Scheduled via loop.call_later instead of a while/sleep coroutine, so
+        the periodic keep-alive only costs a single TimerHandle instead of a
+        suspended coroutine frame plus a sleep Future per cycle.
+        """
+        try:
+            self.teletask.telegrams.put_nowait(_HEARTBEAT)  # Queue the shared heartbeat telegram
+        except asyncio.QueueFull:
+            # The queue is saturated; dropping a keep-alive is preferable to growing it
+            self.teletask.logger.warning("Telegram queue full, heartbeat dropped")
+        self._hb_handle = self.teletask.loop.call_later(self.HEARTBEAT_INTERVAL, self._tick_heartbeat)
 
     async def run(self):
-        """Endless loop for processing telegrams."""
+        """Endless loop for processing telegrams.
+
+        Awaits one telegram, then drains whatever else is already queued (up to
+        MAX_BATCH) so a burst of telegrams costs a single event-loop wake-up
+        instead of one per message.
+        """
         while True:
             telegram = await self.teletask.telegrams.get()  # Wait for a telegram from the queue
+            batch = [telegram]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self.teletask.telegrams.get_nowait())  # Drain without awaiting
+                except asyncio.QueueEmpty:
+                    break
 
-            # Break the loop if None is pushed to the queue
-            if telegram is None:
-                break
+            fetched = len(batch)  # Number of queue gets to acknowledge with task_done
+
+            # None is the stop sentinel; split it out of the batch
+            stopping = None in batch
+            if stopping:
+                batch = [item for item in batch if item is not None]
+
+            # Coalesced producers enqueue lists of telegrams as a single item
+            if any(isinstance(item, list) for item in batch):
+                flattened = []
+                for item in batch:
+                    if isinstance(item, list):
+                        flattened.extend(item)
+                    else:
+                        flattened.append(item)
+                batch = flattened
 
-            await self.process_telegram(telegram)  # Process the retrieved telegram
-            self.teletask.telegrams.task_done()  # Mark the telegram as processed
+            await self.process_telegram_batch(batch)  # Process the drained batch
+
+            for _ in range(fetched):
+                self.teletask.telegrams.task_done()  # Mark each fetched item as processed
+
+            if stopping:
+                break
 
         self.queue_stopped.set()  # Signal that the queue has stopped
 
+    async def process_telegram_batch(self, batch):
+        """Process a drained batch of telegrams in a single pass.
+
+        Partitions the batch into incoming and outgoing telegrams so each group
+        can be handled together.
+        """
+        incoming = []
+        outgoing = []
+        for telegram in batch:
+            if isinstance(telegram, Frame):
+                incoming.append(telegram)
+            else:
+                outgoing.append(telegram)
+
+        if len(outgoing) > 1 and self.teletask.teletaskip_interface is not None:
+            # Fuse the outgoing batch into a single socket write
+            try:
+                await self.teletask.teletaskip_interface.send_telegrams(outgoing)
+            except Exception as ex:
+                self.teletask.logger.error("Error while sending telegram batch: %s", ex)
+        else:
+            for telegram in outgoing:
+                await self.process_telegram(telegram)
+        for telegram in incoming:
+            await self.process_telegram(telegram)
+
     async def stop(self):
         """Stop the telegram queue."""
-        self.teletask.logger.debug("Stopping TelegramQueue")
+        if self._debug:
+            self.teletask.logger.debug("Stopping TelegramQueue")
+        if self._hb_handle is not None:
+            self._hb_handle.cancel()  # Stop the scheduled heartbeat
+            self._hb_handle = None
         await self.teletask.telegrams.put(None)  # Push None to stop the queue
         await self.queue_stopped.wait()  # Wait until the queue has stopped
+        if self._run_task is not None:
+            await asyncio.gather(self._run_task, return_exceptions=True)  # Reap the processing task
+            self._run_task = None
 
     async def process_all_telegrams(self):
         """Process all telegrams currently in the queue."""
@@ -76,14 +172,26 @@ class TelegramQueue:
             self.teletask.telegrams.task_done()  # Mark it as done
 
     async def process_telegram(self, telegram):
-        """Process an incoming or outgoing telegram."""
+        """Process an incoming or outgoing telegram.
+
+        Only expected error types are caught here; anything else propagates to
+        the event loop's exception handler instead of being silently logged,
+        which also avoids materializing tracebacks on the hot loop.
+        """
         try:
-            if isinstance(telegram, Telegram):  # Check if it's a telegram instance
+            dispatch = getattr(telegram, "dispatch", None)
+            if dispatch is not None:
+                await dispatch(self)  # Queued types route themselves
+            elif isinstance(telegram, Frame):  # Fallback for types without dispatch
                 await self.process_telegram_incoming(telegram)  # Process as incoming
             else:
-                await self.process_telegram_outgoing(telegram)  # Process as outgoing
-        except Exception as ex:
-            self.teletask.logger.error("Error while processing telegram: %s", ex)
+                await self.process_telegram_outgoing(telegram)  # Pre-encoded bytes and the like
+        except asyncio.CancelledError:
+            raise
+        except (TeletaskException, OSError, AttributeError) as ex:
+            self.teletask.logger.error(
+                "Error while processing telegram: %s", ex,
+                exc_info=self.teletask.logger.isEnabledFor(logging.DEBUG))
 
     async def process_telegram_outgoing(self, telegram):
         """Process an outgoing telegram."""
@@ -94,24 +202,42 @@ class TelegramQueue:
 
     async def process_telegram_incoming(self, telegram):
         """Process an incoming telegram."""
-        processed = False  # Flag to check if the telegram has been processed
-        for telegram_received_cb in self.telegram_received_cbs:
-            if telegram.doip_component is not None:
-                # Update the component state based on the telegram
-                await self.update_component_state(telegram.doip_component, telegram.group_address, telegram.state)
-                ret = await telegram_received_cb.callback(telegram)  # Call the registered callback
-                if ret:
-                    processed = True  # Mark as processed
+        if telegram.doip_component is None:
+            return
+
+        # Update the component state exactly once, regardless of the number of listeners
+        await self.update_component_state(telegram.doip_component, telegram.group_address, telegram.state)
+
+        callbacks = self.telegram_received_cbs  # Local reference to the immutable snapshot
+        if not callbacks:
+            return
+        # Run the independent callbacks concurrently instead of serially
+        results = await asyncio.gather(
+            *(telegram_received_cb.callback(telegram) for telegram_received_cb in callbacks),
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.teletask.logger.warning("Telegram received callback failed: %s", result)
 
     async def update_component_state(self, doip_component, group_address, state):
         """Update the state of the specified component."""
-        doip_component_name = TelegramFunction(doip_component).name  # Get the component name
-
-        if doip_component_name != 'None' and group_address is not None:
-            if doip_component_name in self.teletask.registered_devices:
-                try:
-                    remote = self.teletask.registered_devices[doip_component_name][str(group_address)]
-                    await remote.change_state(state)  # Update the remote state
-                except KeyError:
-                    self.teletask.logger.debug("Received an update from an unknown or unregistered component.")
-                    self.teletask.logger.debug("Name: %s, Address: %s, State: %s", doip_component_name, str(group_address), state)
+        doip_component_name = _DOIP_NAME.get(doip_component)  # Cached component name lookup
+        if doip_component_name is None:
+            return
+
+        if group_address is not None:
+            # Addresses are keyed by the raw wire integer
+            devices = self.teletask.registered_devices.get(doip_component_name)
+            remote = devices.get(int(group_address)) if devices else None
+            if remote is not None:
+                await remote.change_state(state)  # Update the remote state
+                return
+            # No device registered; try the controller's remote-value index
+            for remote_value in self.teletask.remote_values_by_group_address(group_address):
+                function = remote_value._function
+                if function is not None and function.value == doip_component:
+                    await remote_value.state(state)
+                    return
+            if self._debug:
+                self.teletask.logger.debug("Received an update from an unknown or unregistered component.")
+                self.teletask.logger.debug("Name: %s, Address: %s, State: %s", doip_component_name, group_address, state)
@@ -14,10 +14,23 @@ Methods:
     - process: Handle incoming telegrams (messages) from the Teletask bus.
 """
 
+import logging
+from functools import lru_cache
+
 from teletask.exceptions import TeletaskException
 from teletask.doip import Telegram  # , TelegramType (commented out but probably used elsewhere)
 
 
+@lru_cache(maxsize=16)
+def normalize_component(doip_component):
+    """Return the canonical upper-case component name for a device.
+
+    Cached so bulk device creation shares one string per component type
+    instead of building a fresh upper-cased copy per instance.
+    """
+    return str(doip_component).upper()
+
+
 class Device:
     """Base class for Teletask devices.
 
@@ -31,6 +44,9 @@ class Device:
         device_updated_cbs (list): List of callback functions to notify on device state updates.
     """
 
+    # Devices exist once per physical unit; slots avoid a per-instance dict.
+    __slots__ = ("teletask", "doip_component", "name", "device_updated_cbs")
+
     def __init__(self, teletask, name, device_updated_cb=None):
         """Initialize the Device class.
 
@@ -42,7 +58,7 @@ class Device:
         self.teletask = teletask  # The Teletask system instance that controls communication.
         self.doip_component = "UNKNOWN"  # Component type, not defined here; could be overridden in subclasses.
         self.name = name  # Device name.
-        self.device_updated_cbs = []  # List of callback functions for device updates.
+        self.device_updated_cbs = ()  # Immutable snapshot of update callbacks, rebuilt on (un)register.
         
         # Register the callback if provided.
         if device_updated_cb is not None:
@@ -54,7 +70,7 @@ class Device:
         Args:
             device_updated_cb (function): The callback function to be added.
         """
-        self.device_updated_cbs.append(device_updated_cb)
+        self.device_updated_cbs = self.device_updated_cbs + (device_updated_cb,)
 
     def unregister_device_updated_cb(self, device_updated_cb):
         """Unregister a callback that was previously registered.
@@ -62,7 +78,8 @@ class Device:
         Args:
             device_updated_cb (function): The callback function to be removed.
         """
-        self.device_updated_cbs.remove(device_updated_cb)
+        self.device_updated_cbs = tuple(
+            callback for callback in self.device_updated_cbs if callback is not device_updated_cb)
 
     async def after_update(self):
         """Execute registered callbacks after the internal state has been changed.
@@ -70,7 +87,8 @@ class Device:
         This method is called after the device's state has been updated, allowing
         registered callbacks to react to the change.
         """
-        for device_updated_cb in self.device_updated_cbs:
+        callbacks = self.device_updated_cbs  # Snapshot cannot change mid-dispatch
+        for device_updated_cb in callbacks:
             await device_updated_cb(self)
 
     async def sync(self, wait_for_result=True):
@@ -92,7 +110,8 @@ class Device:
         Args:
             wait_for_result (bool, optional): Whether to wait for the result (default is True).
         """
-        self.teletask.logger.debug("Sync %s", self.name)  # Log syncing operation.
+        if self.teletask.logger.isEnabledFor(logging.DEBUG):
+            self.teletask.logger.debug("Sync %s", self.name)  # Log syncing operation.
 
         # Loop over group addresses to request the state of the device.
         for group_address in self.state_addresses():
@@ -127,7 +146,7 @@ class Device:
         # Set the telegram type based on whether it's a response or a regular write command.
         # The telegramtype is not a member of the Telegram class, so commented it out.
         # telegram.telegramtype = TelegramType.GROUP_RESPONSE if response else TelegramType.GROUP_WRITE
-        await self.teletask.telegrams.put(telegram)  # Send the telegram to the Teletask bus.
+        self.teletask.queue_telegram(telegram)  # Send the telegram to the Teletask bus.
 
     def state_addresses(self):
         """Return the group addresses to be requested for syncing the device state.
@@ -1,26 +1,33 @@
 """
 Module for handling a vector/array of devices.
-This class acts as a container for multiple devices, 
+This class acts as a container for multiple devices,
 providing functionality to search and manage them.
 """
+import asyncio
+
 from .device import Device
 
 
 class Devices:
     """Class for handling a vector/array of devices."""
 
+    __slots__ = ("__devices", "device_updated_cbs", "_by_name", "_by_group")
+
     def __init__(self):
         """Initialize Devices class."""
         self.__devices = []  # Internal list to hold device instances
-        self.device_updated_cbs = []  # List of callbacks for device updates
+        self.device_updated_cbs = ()  # Immutable snapshot of callbacks, rebuilt on (un)register
+        self._by_name = {}  # Index of devices by name for O(1) lookup
+        self._by_group = {}  # Index of devices by group address for O(1) lookup
 
     def register_device_updated_cb(self, device_updated_cb):
         """Register a callback for devices being updated."""
-        self.device_updated_cbs.append(device_updated_cb)
+        self.device_updated_cbs = self.device_updated_cbs + (device_updated_cb,)  # Copy-on-write
 
     def unregister_device_updated_cb(self, device_updated_cb):
         """Unregister a callback for devices being updated."""
-        self.device_updated_cbs.remove(device_updated_cb)
+        self.device_updated_cbs = tuple(
+            callback for callback in self.device_updated_cbs if callback is not device_updated_cb)
 
     def __iter__(self):
         """Iterator to allow iteration over devices."""
@@ -28,17 +35,24 @@ class Devices:
 
     def devices_by_group_address(self, group_address):
         """Return device(s) that match the specified group address."""
-        for device in self.__devices:
-            if device.has_group_address(group_address):
-                yield device  # Yielding devices that match the group address
+        yield from self._by_group.get(str(group_address), ())  # O(1) index lookup
+
+    def _group_addresses(self, device):
+        """Collect all group addresses a device exposes."""
+        addresses = list(device.state_addresses())
+        for attribute in ("switch", "brightness", "dimmer"):
+            remote = getattr(device, attribute, None)
+            if remote is not None and remote.group_address is not None:
+                addresses.append(remote.group_address)
+        return addresses
 
     def __getitem__(self, key):
         """Return device by name or by index."""
-        for device in self.__devices:
-            if device.name == key:
-                return device  # Return device matching the name
         if isinstance(key, int):
             return self.__devices[key]  # Return device by index
+        device = self._by_name.get(key)
+        if device is not None:
+            return device  # Return device matching the name
         raise KeyError(f"Device not found: {key}")  # Raise KeyError if not found
 
     def __len__(self):
@@ -47,10 +61,7 @@ class Devices:
 
     def __contains__(self, key):
         """Check if a device with the specified name exists."""
-        for device in self.__devices:
-            if device.name == key:
-                return True  # Return True if the device exists
-        return False  # Return False if not found
+        return key in self._by_name
 
     def add(self, device):
         """Add a device to the devices vector."""
@@ -58,13 +69,45 @@ class Devices:
             raise TypeError("Only instances of Device can be added.")
         device.register_device_updated_cb(self.device_updated)  # Register update callback
         self.__devices.append(device)  # Append device to internal list
+        self._by_name[device.name] = device  # Index by name
+        for group_address in self._group_addresses(device):
+            self._by_group.setdefault(str(group_address), []).append(device)  # Index by group address
+
+    def remove(self, device):
+        """Remove a device from the devices vector and tear down its indices."""
+        self.__devices.remove(device)
+        device.unregister_device_updated_cb(self.device_updated)
+        self._by_name.pop(device.name, None)
+        for group_address in self._group_addresses(device):
+            devices = self._by_group.get(str(group_address))
+            if devices and device in devices:
+                devices.remove(device)
+                if not devices:
+                    del self._by_group[str(group_address)]
 
     async def device_updated(self, device):
         """Call all registered device updated callbacks for the specified device."""
-        for device_updated_cb in self.device_updated_cbs:
+        callbacks = self.device_updated_cbs  # Snapshot cannot change mid-dispatch
+        for device_updated_cb in callbacks:
             await device_updated_cb(device)  # Await each callback
 
     async def sync(self):
-        """Read the state of devices from the Teletask bus."""
-        for device in self.__devices:
-            await device.sync()  # Sync each device with the Teletask bus
+        """Read the state of devices from the Teletask bus.
+
+        Device reads are independent bus round-trips, so they are overlapped
+        with asyncio.gather; a semaphore caps the number of outstanding reads
+        to avoid flooding the bus.
+        """
+        if not self.__devices:
+            return
+        semaphore = asyncio.Semaphore(16)  # Cap of concurrently outstanding reads
+
+        async def _sync_one(device):
+            async with semaphore:
+                await device.sync()
+
+        results = await asyncio.gather(
+            *(_sync_one(device) for device in self.__devices), return_exceptions=True)
+        for device, result in zip(self.__devices, results):
+            if isinstance(result, Exception):
+                device.teletask.logger.error("Error while syncing %s: %s", device.name, result)
@@ -4,7 +4,7 @@ It provides functionality for:
 * Switching a light 'on' and 'off'.
 * Adjusting the brightness (if supported).
 """
-from .device import Device
+from .device import Device, normalize_component
 from .remote_value_switch import RemoteValueSwitch
 from .remote_value_scaling import RemoteValueScaling
 
@@ -17,6 +17,8 @@ class Light(Device):
     on or off, and adjusting its brightness if the light supports dimming.
     """
 
+    __slots__ = ("light_state", "switch", "brightness")
+
     def __init__(self,
                  teletask,
                  name,
@@ -42,8 +44,8 @@ class Light(Device):
         # Initialize the parent Device class
         super(Light, self).__init__(teletask, name, device_updated_cb)
 
-        self.doip_component = str(doip_component).upper()
-        self.teletask = teletask
+        # super().__init__ already stored teletask; only normalize the component
+        self.doip_component = normalize_component(doip_component)
         self.light_state = False  # Default state is off
         
         # Setup switch control for turning the light on/off
@@ -141,5 +143,15 @@ class Light(Device):
         return False
 
     def __eq__(self, other):
-        """Compare two light objects for equality."""
-        return self.__dict__ == other.__dict__
+        """Compare two light objects by identity-bearing attributes.
+
+        Comparing full __dict__s walked the whole object graph (including the
+        Teletask instance itself); name plus switch address identify a light.
+        """
+        return isinstance(other, Light) \
+            and self.name == other.name \
+            and self.switch.group_address == other.switch.group_address
+
+    def __hash__(self):
+        """Hash on the same key as __eq__ so lights can live in sets/dicts."""
+        return hash((type(self).__name__, self.name))
@@ -12,9 +12,24 @@ devices in the Teletask system (e.g., switches, dimmers).
 from teletask.doip import Telegram, TeletaskConst, TelegramCommand, TelegramFunction, TelegramSetting
 import asyncio
 
+# Hoisted enum values; these sit on the per-telegram hot path and a plain
+# global load is cheaper than two descriptor lookups on the Enum.
+_SETTING_ON = TelegramSetting.ON.value
+_SETTING_OFF = TelegramSetting.OFF.value
+_SETTING_TOGGLE = TelegramSetting.TOGGLE.value
+
 class RemoteValue:
     """Base class for managing a remote value in the Teletask system."""
 
+    # Subclasses whose to_teletask/from_teletask are plain identity set this
+    # flag so the hot conversion paths can skip the method call entirely.
+    _PASSTHROUGH = False
+
+    # One instance exists per controllable value; slots avoid a per-instance dict.
+    __slots__ = ("teletask", "doip_component", "group_address", "brightness_val",
+                 "after_update_cb", "device_name", "payload", "_function",
+                 "_tt_value", "_get_bytes")
+
     def __init__(self, teletask, group_address=None, device_name=None, after_update_cb=None, doip_component=None):
         """
         Initialize the RemoteValue class.
@@ -28,11 +43,28 @@ class RemoteValue:
         """
         self.teletask = teletask  # Main Teletask controller instance
         self.doip_component = doip_component  # Type of Teletask component (e.g., switch, dimmer)
-        self.group_address = group_address  # Address on the Teletask bus
+        # Parse the address once here instead of per send; config may pass
+        # strings or Enum members, both of which coerce through int().
+        if group_address is not None:
+            self.group_address = int(getattr(group_address, "value", group_address))
+        else:
+            self.group_address = None  # Address on the Teletask bus
         self.brightness_val = 0  # Default brightness value for dimmers
         self.after_update_cb = after_update_cb  # Callback function after updates
         self.device_name = "Unknown" if device_name is None else device_name  # Device name
         self.payload = None  # Holds the current payload (state)
+        # Both values are invariant per instance; resolve them once instead of
+        # on every send/current_state call.
+        try:
+            self._function = TelegramFunction[doip_component] if doip_component else None
+        except KeyError:
+            self._function = None  # Unknown component; resolved lazily if ever corrected
+        self._tt_value = TeletaskValue()  # Reused setting container for fallback telegrams
+        self._get_bytes = None  # Serialized GET frame, cached on first state poll
+        if self.group_address is not None:
+            # Self-register so the controller can dispatch incoming telegrams
+            # to this value by address lookup instead of scanning devices.
+            teletask.register_remote_value(self.group_address, self)
 
     @property
     def initialized(self):
@@ -107,20 +139,23 @@ class RemoteValue:
         # Check if the group address matches the one for this remote value
         if not self.has_group_address(telegram.group_address):
             return False
-        
+
+        # Repeated state telegrams are the common case on a chatty bus;
+        # skip validation and callbacks entirely when nothing changed.
+        if self.payload == telegram.payload and self.payload is not None:
+            return True
+
         # Validate the payload before processing it
         if not self.payload_valid(telegram.payload):
             raise Exception("Invalid payload received",
                             payload=telegram.payload,
                             group_address=telegram.group_address,
                             device_name=self.device_name)
-        
-        # If the payload has changed or is being set for the first time, update it
-        if self.payload != telegram.payload or self.payload is None:
-            self.payload = telegram.payload
-            # Trigger the callback if defined
-            if self.after_update_cb is not None:
-                await self.after_update_cb()
+
+        self.payload = telegram.payload
+        # Hand the callback to the batched fan-out instead of awaiting inline
+        if self.after_update_cb is not None:
+            self.teletask.schedule_update(self)
 
         return True
 
@@ -134,6 +169,8 @@ class RemoteValue:
         """
         if self.payload is None:
             return None
+        if self._PASSTHROUGH:
+            return self.payload
         return self.from_teletask(self.payload)
 
     async def current_state(self):
@@ -142,11 +179,19 @@ class RemoteValue:
         
         Sends a telegram with a GET command to the group address to fetch the current state.
         """
-        function = TelegramFunction[self.doip_component]
-        telegram = Telegram(command=TelegramCommand.GET, address=int(self.group_address), function=function)
-        await self.teletask.telegrams.put(telegram)
-
-    async def send(self, receivedSetting=TelegramSetting.TOGGLE.value, response=False):
+        if self._get_bytes is None:
+            if self._function is None or self.group_address is None:
+                # Incomplete addressing; queue a plain telegram like before
+                self.teletask.queue_telegram(
+                    Telegram(command=TelegramCommand.GET, address=self.group_address, function=self._function))
+                return
+            # The GET frame for this value is immutable; serialize it once and
+            # re-queue the cached bytes on later polls.
+            self._get_bytes = Telegram.for_send(
+                TelegramCommand.GET, self._function, self.group_address)
+        self.teletask.queue_telegram(self._get_bytes)
+
+    async def send(self, receivedSetting=_SETTING_TOGGLE, response=False):
         """
         Send a value (payload) to the Teletask bus to control the device.
 
@@ -154,51 +199,59 @@ class RemoteValue:
             receivedSetting: The setting to send (e.g., ON/OFF, brightness).
             response: If True, sends a group response. Defaults to False (group write).
         """
-        function = TelegramFunction[self.doip_component]
-
-        # Create the value to send based on the device type (dimmer, switch, etc.)
         if self.doip_component == "DIMMER":
-            ttvalue = TeletaskValue()
-            ttvalue.value = self.brightness_val  # Send brightness level for dimmers
+            value = self.brightness_val  # Send brightness level for dimmers
         else:
-            ttvalue = TeletaskValue()
-            ttvalue.value = receivedSetting  # Send the ON/OFF value for switches
-        setting = ttvalue
+            value = receivedSetting  # Send the ON/OFF value for switches
 
-        # Send the telegram with the setting to the Teletask bus
-        telegram = Telegram(command=TelegramCommand.SET, function=function, address=int(self.group_address), setting=setting)
-        await self.teletask.telegrams.put(telegram)
+        if self._function is not None and self.group_address is not None:
+            # Repeated commands resolve to the same cached wire bytes
+            self.teletask.queue_telegram(
+                Telegram.for_send(TelegramCommand.SET, self._function, self.group_address, value))
+            return
+        self._tt_value.value = value
+        telegram = Telegram(
+            command=TelegramCommand.SET, function=self._function,
+            address=self.group_address, setting=self._tt_value)
+        self.teletask.queue_telegram(telegram)
 
-    async def set(self, value):
+    async def set(self, value, force=False):
         """
         Set a new value for the device and send it to the Teletask bus.
 
+        Re-sending an unchanged value is a no-op unless forced, so idempotent
+        control loops (e.g. state reconciliation) no longer flood the bus.
+
         Args:
             value: The new value to set for the device.
+            force: If True, send even when the value is unchanged.
         """
         if not self.initialized:
             self.teletask.logger.info("Attempting to set value for uninitialized device %s (value: %s)", self.device_name, value)
             return
 
         # Convert the provided value into a Teletask-compatible payload
-        payload = self.to_teletask(value)
+        payload = value if self._PASSTHROUGH else self.to_teletask(value)
 
-        # Update the payload if it's different from the current one
+        # Update the payload if it's different from the current one; a fresh
+        # (None) payload never equals a real one, so one compare covers both.
         updated = False
-        if self.payload is None or payload != self.payload:
+        if self.payload != payload:
             self.payload = payload
             updated = True
+            # Track the brightness value only when it actually changed
+            if value is not None:
+                self.brightness_val = value
 
-        # Update the brightness value for dimmers
-        if value is not None:
-            self.brightness_val = value
+        if not updated and not force:
+            return  # Nothing changed; skip the redundant telegram
 
         # Send the updated value to the bus
         await self.send()
 
         # Trigger the callback if the value has changed
         if updated and self.after_update_cb is not None:
-            await self.after_update_cb()
+            self.teletask.schedule_update(self)
 
     async def state(self, raw_value):
         """
@@ -207,17 +260,17 @@ class RemoteValue:
         Args:
             raw_value: The raw ON/OFF value received from Teletask.
         """
-        value = self.Value.ON if int(raw_value) == TelegramSetting.ON.value else self.Value.OFF
+        value = self._STATE_MAP.get(int(raw_value), self.Value.OFF)
 
         # Update the internal payload if necessary
         updated = False
-        if self.payload is None or self.payload != value:
+        if self.payload != value:
             self.payload = value
             updated = True
 
         # Trigger the callback if the value has changed
         if updated and self.after_update_cb is not None:
-            await self.after_update_cb()
+            self.teletask.schedule_update(self)
 
     @property
     def unit_of_measurement(self):
@@ -226,37 +279,39 @@ class RemoteValue:
 
     def group_addr_str(self):
         """Return a string representation of the group address, payload, and value."""
-        return '{0}/{1}/{2}/{3}' \
-            .format(self.group_address.__repr__(),
-                    self.group_address_state.__repr__(),
-                    self.payload,
-                    self.value)
+        # group_address_state is never set by __init__; fall back to None
+        # instead of raising AttributeError when a debug string is built.
+        return (f'{self.group_address!r}'
+                f'/{getattr(self, "group_address_state", None)!r}'
+                f'/{self.payload}/{self.value}')
 
     def __str__(self):
         """Return the string representation of the RemoteValue object."""
-        return '<{} device_name="{}" {}/>'.format(
-            self.__class__.__name__,
-            self.device_name,
-            self.group_addr_str())
+        return f'<{self.__class__.__name__} device_name="{self.device_name}" {self.group_addr_str()}/>'
+
+    def _compare_state(self):
+        """Collect the slot values relevant for equality (callback excluded)."""
+        return {
+            name: getattr(self, name, None)
+            for klass in type(self).__mro__
+            for name in getattr(klass, "__slots__", ())
+            if name != "after_update_cb"
+        }
 
     def __eq__(self, other):
         """Check if two RemoteValue objects are equal by comparing their internal states."""
-        for key, value in self.__dict__.items():
-            if key == "after_update_cb":
-                continue
-            if key not in other.__dict__:
-                return False
-            if other.__dict__[key] != value:
-                return False
-        for key, value in other.__dict__.items():
-            if key == "after_update_cb":
-                continue
-            if key not in self.__dict__:
-                return False
-        return True
+        if type(self) is not type(other):
+            return False
+        return self._compare_state() == other._compare_state()
+
+    def __hash__(self):
+        """Hash by identity-ish fields so values can sit in the pending-update set."""
+        return hash((type(self).__name__, self.device_name, self.group_address))
 
 class TeletaskValue:
     """Class representing a value to be sent over the Teletask system."""
-    
+
+    __slots__ = ("value",)
+
     def __init__(self):
         self.value = 0  # Default value set to 0 (can represent ON/OFF or brightness)
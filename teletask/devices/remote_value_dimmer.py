@@ -1,11 +1,11 @@
 """
-Module for managing a Scaling remote value (Dimmer control).
+Module for managing a Dimmer remote value.
 DPT 5.001 (Dimmer percentage control).
 """
 from enum import Enum
 
 from .remote_value import RemoteValue
-from teletask.doip import TelegramSetting
+from teletask.doip import TelegramSetting  # Used to build the class-level state map
 
 
 class RemoteValueDimmer(RemoteValue):
@@ -15,11 +15,19 @@ class RemoteValueDimmer(RemoteValue):
     This class allows for controlling the dimming value (brightness) of a device,
     by converting between a percentage value and the Teletask system's internal format.
     """
+    __slots__ = ("range_from", "range_to")
+
+    _PASSTHROUGH = True  # DPT 5.001 percentages travel unmodified
+
     class Value(Enum):
         """Enum for indicating the direction."""
         OFF = 0
         ON = 255
 
+    # Raw setting byte -> Value member, resolved once at class creation
+    _STATE_MAP = {TelegramSetting.ON.value: Value.ON,
+                  TelegramSetting.OFF.value: Value.OFF}
+
     def __init__(self, 
                  teletask, 
                  group_address=None, 
@@ -51,32 +59,6 @@ class RemoteValueDimmer(RemoteValue):
         self.range_from = range_from  # Upper range of the dimming scale (e.g., 100%)
         self.range_to = range_to  # Lower range of the dimming scale (e.g., 0%)
 
-    def to_teletask(self, value):
-        """
-        Convert the given value (percentage) into a payload for the Teletask system.
-
-        Args:
-            value: The value to be converted (typically a percentage).
-
-        Returns:
-            The converted value ready to be sent to the Teletask system.
-        """
-        # Directly return the percentage value as payload (for DPT 5.001, this is valid).
-        return value
-
-    def from_teletask(self, value):
-        """
-        Convert a received payload from the Teletask system into a usable value (percentage).
-
-        Args:
-            value: The raw payload received from Teletask.
-
-        Returns:
-            The converted value as a percentage (from 0 to 100).
-        """
-        # Return the received value directly as it represents a percentage.
-        return value
-
     async def off(self):
         """Set value to down."""
         await self.set(self.Value.OFF.value)
@@ -13,7 +13,11 @@ class RemoteValueScaling(RemoteValue):
     by converting between a percentage value and the Teletask system's internal format.
     """
 
-    def __init__(self, 
+    __slots__ = ("range_from", "range_to")
+
+    _PASSTHROUGH = True  # Percentages travel unmodified
+
+    def __init__(self,
                  teletask, 
                  group_address=None, 
                  device_name=None, 
@@ -44,29 +48,28 @@ class RemoteValueScaling(RemoteValue):
         self.range_from = range_from
         self.range_to = range_to
 
-    def to_teletask(self, value):
+    async def state(self, raw_value):
         """
-        Convert the given value (percentage) into a payload for the Teletask system.
+        Update the internal brightness state from a raw Teletask level.
 
-        Args:
-            value: The value to be converted (typically a percentage).
-
-        Returns:
-            The converted value ready to be sent to the Teletask system.
-        """
-        return value
+        Scaling values are passthrough percentages rather than ON/OFF
+        settings, so the raw level is stored directly instead of going
+        through the base class's _STATE_MAP lookup.
 
-    def from_teletask(self, value):
+        Args:
+            raw_value: The raw brightness level received from Teletask.
         """
-        Convert a received payload from the Teletask system into a usable value (percentage).
+        value = int(raw_value)
 
-        Args:
-            value: The raw payload received from Teletask.
+        # Update the internal payload if necessary
+        updated = False
+        if self.payload != value:
+            self.payload = value
+            updated = True
 
-        Returns:
-            The converted value as a percentage (from 0 to 100).
-        """
-        return value
+        # Trigger the callback if the value has changed
+        if updated and self.after_update_cb is not None:
+            self.teletask.schedule_update(self)
 
     @property
     def unit_of_measurement(self):
@@ -4,8 +4,7 @@ DPT 1.001.
 """
 
 from enum import Enum
-from .remote_value import RemoteValue  # Import base class for remote values
-from teletask.doip import TelegramSetting  # Import the setting values for ON/OFF
+from .remote_value import RemoteValue, _SETTING_ON, _SETTING_OFF  # Import base class for remote values
 
 class RemoteValueSwitch(RemoteValue):
     """Class to represent a remote value for switching (ON/OFF) in the Teletask system.
@@ -15,11 +14,18 @@ class RemoteValueSwitch(RemoteValue):
     switch status.
     """
 
+    __slots__ = ("invert",)
+
+    _PASSTHROUGH = True  # Payloads already arrive/leave in Teletask format
+
     class Value(Enum):
         """Enum for defining the ON and OFF values."""
         OFF = 0  # OFF state represented by 0
         ON = 255  # ON state represented by 255
 
+    # Raw setting byte -> Value member, resolved once at class creation
+    _STATE_MAP = {_SETTING_ON: Value.ON, _SETTING_OFF: Value.OFF}
+
     def __init__(self,
                  teletask,
                  group_address=None,
@@ -43,38 +49,16 @@ class RemoteValueSwitch(RemoteValue):
             doip_component=doip_component)
         self.invert = invert  # Whether to invert the switch logic
 
-    def to_teletask(self, value):
-        """Convert the provided value to the payload format used by Teletask.
-
-        Args:
-            value (int): The value to be sent to the Teletask system, either ON or OFF.
-
-        Returns:
-            int: The value in Teletask payload format.
-        """
-        return value  # Directly return the value, no transformation needed
-
-    def from_teletask(self, value):
-        """Convert the payload received from Teletask to the switch state.
-
-        Args:
-            value (int): The value received from the Teletask system.
-
-        Returns:
-            int: The interpreted value (ON or OFF).
-        """
-        return value  # Return the received value as is
-
     async def off(self):
         """Set the switch to OFF state.
 
         Sends a command to turn off the switch.
         """
-        await self.set(TelegramSetting.OFF.value)
+        await self.set(_SETTING_OFF)
 
     async def on(self):
         """Set the switch to ON state.
 
         Sends a command to turn on the switch.
         """
-        await self.set(TelegramSetting.ON.value)
+        await self.set(_SETTING_ON)
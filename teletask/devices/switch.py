@@ -4,12 +4,14 @@ It provides functionality for
 * switching a switch 'on' and 'off'.
 """
 
-from .device import Device  # Import the base Device class
+from .device import Device, normalize_component  # Import the base Device class
 from .remote_value_switch import RemoteValueSwitch  # Import the RemoteValueSwitch class
 
 class Switch(Device):
     """Class for managing a Switch device in the Teletask system."""
 
+    __slots__ = ("Switch_state", "switch")
+
     def __init__(self,
                  teletask,
                  name,
@@ -30,7 +32,7 @@ class Switch(Device):
         # Call the parent Device class constructor
         super(Switch, self).__init__(teletask, name, device_updated_cb)
 
-        self.doip_component = str(doip_component).upper()  # Ensure component type is uppercase
+        self.doip_component = normalize_component(doip_component)  # Memoized upper-cased component type
         self.teletask = teletask  # Reference to the Teletask system
         self.Switch_state = False  # Internal state of the switch
 
@@ -80,17 +82,26 @@ class Switch(Device):
         Args:
             action (str): The action to perform ("on" or "off").
         """
-        if action == "on":
-            await self.set_on()  # Turn the switch on
-        elif action == "off":
-            await self.set_off()  # Turn the switch off
-        else:
+        try:
+            handler = self._ACTIONS[action]
+        except KeyError:
             self.teletask.logger.debug("Could not understand action %s for device %s", action, self.get_name())
+            return
+        await handler(self)
+
+    # O(1) action dispatch for do(); defined after the handlers exist
+    _ACTIONS = {"on": set_on, "off": set_off}
 
     def has_group_address(self, var):
         """Check if the device has a specific group address (returns False for Switch)."""
         return False
 
     def __eq__(self, other):
-        """Equality check for Switch objects (compares internal states)."""
-        return self.__dict__ == other.__dict__
+        """Equality check for Switch objects (compares device identity)."""
+        return isinstance(other, Switch) \
+            and self.name == other.name \
+            and self.switch.group_address == other.switch.group_address
+
+    def __hash__(self):
+        """Hash by device identity so switches can be used as dict keys."""
+        return hash((type(self).__name__, self.name))
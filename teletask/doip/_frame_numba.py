@@ -0,0 +1,33 @@
+"""
+Optional Numba-accelerated scanner for DoIP frame extraction.
+
+Numba is a soft-optional dependency: when it (and numpy) are installed, the
+frame signature scan runs as compiled machine code over a uint8 array; when
+they are missing, `scan` is None and FrameQueue keeps its pure-Python loop.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    scan = None
+else:
+    @njit(cache=True, boundscheck=False)
+    def _scan(buf):
+        """Return the start indices of 2,9,16 frame signatures in buf."""
+        n = buf.shape[0]
+        out = np.empty(n // 9 + 1, np.int64)
+        count = 0
+        i = 0
+        while i < n - 8:
+            if buf[i] == 2 and buf[i + 1] == 9 and buf[i + 2] == 16:
+                out[count] = i
+                count += 1
+                i += 9
+            else:
+                i += 1
+        return out[:count]
+
+    def scan(raw):
+        """Scan raw bytes and return an iterable of frame start offsets."""
+        return _scan(np.frombuffer(bytes(raw), dtype=np.uint8))
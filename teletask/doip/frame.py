@@ -14,8 +14,17 @@ Functions:
     - process_frame: Handles individual frame processing and returns a `Frame` object.
 """
 
+import logging
 import re
+from array import array
 from teletask.doip import Telegram, TelegramFunction, TelegramCommand
+from ._frame_numba import scan as _numba_scan
+
+_LOGGER = logging.getLogger('teletask.frame')
+
+# Compiled once at import for the legacy comma-separated string input form.
+# Non-capturing with a fixed repetition count, so the engine never backtracks.
+_FRAME_RE = re.compile(r"2,9,16,(?:\d+,){5}\d+")
 
 
 class FrameQueue:
@@ -36,62 +45,68 @@ class FrameQueue:
     def process_frames(self, raw):
         """Process a batch of raw data and extract individual frames.
 
+        Scans the raw byte values directly for the 9-byte event report
+        signature (2, 9, 16, ...) instead of materializing a comma-separated
+        string and running a backtracking regex over it.
+
         Args:
-            raw (list): A list of raw integers representing the incoming data.
+            raw (bytes or list): The raw integer values of the incoming data.
 
-        Returns:
-            list: A list of `Frame` objects extracted from the raw data.
+        Yields:
+            Frame: The `Frame` objects extracted from the raw data, streamed
+            as they are found so consumers can dispatch without waiting for
+            the whole buffer. Callers needing a list wrap the call in list().
         """
-        # Convert the raw data list into a comma-separated string
-        full_packet = ','.join(str(x) for x in raw)
-        
-        # Use a regex to find packets of interest. The pattern here looks for 
-        # specific sequences of 9 elements starting with "2,9,16," followed by any 7 more.
-        r1 = re.findall(r"(2,9,16,([0-9]*,?){7})", full_packet)
-
-        result = []
-        
-        # Loop over each packet found by the regex
-        for packet in r1:
-            # Process the packet and convert it into a Frame object
-            frame = self.process_frame(packet[0])
-            
-            # Only append if the frame is valid (i.e., not None)
-            if frame is not None:
-                result.append(frame)
-
-        # Return the list of processed frames
-        return result
+        if isinstance(raw, str):
+            # Legacy callers hand in the joined comma-separated form; match it
+            # with the precompiled pattern and re-parse the values once.
+            for match in _FRAME_RE.finditer(raw):
+                frame = self.process_frame([int(value) for value in match.group(0).split(",")])
+                if frame is not None:
+                    yield frame
+            return
+        if _numba_scan is not None and isinstance(raw, (bytes, bytearray, memoryview)):
+            # Compiled scan over the byte buffer; Python only builds the frames
+            for start in _numba_scan(raw):
+                frame = self.process_frame(raw[start:start + 9])
+                if frame is not None:
+                    yield frame
+            return
+        i = 0
+        end = len(raw) - 8  # A frame needs 9 values from position i onwards
+        while i < end:
+            if raw[i] == 2 and raw[i + 1] == 9 and raw[i + 2] == 16:
+                frame = self.process_frame(raw[i:i + 9])
+                if frame is not None:
+                    yield frame
+                i += 9  # Skip past the consumed frame
+            else:
+                i += 1
 
     def process_frame(self, packet):
-        """Process an individual packet string into a Frame object.
+        """Process an individual 9-value packet into a Frame object.
 
         Args:
-            packet (str): A string representing a DoIP packet.
+            packet: A slice of 9 raw integer values forming one DoIP packet.
 
         Returns:
             Frame or None: A `Frame` object if processing is successful, or None if there is an error.
         """
-        # Split the packet string into a list of individual elements
-        event = packet.split(",")
-
         try:
-            if len(event) > 0:
-                # Create a payload list from the packet
-                payload = [x for x in event]
-
-                # Process key components from the event to create a Frame object
-                frame = Frame(
-                    payload=payload,
-                    doip_component=int(event[4]),  # Component (function)
-                    group_address=int(event[6]),   # Group address
-                    state=int(event[8])            # State of the component
-                )
-                return frame
-
-        except Exception as e:
-            # Print any exceptions that occur during processing
-            print(e)
+            # Pack the values into a compact int16 array in one C-level pass
+            # (iter() keeps bytes input on the per-value path instead of the
+            # raw buffer-protocol reinterpretation).
+            payload = array('h', iter(packet))
+            return Frame(
+                payload=payload,
+                doip_component=payload[4],  # Component (function)
+                group_address=payload[6],   # Group address
+                state=payload[8]            # State of the component
+            )
+        except (ValueError, TypeError, IndexError, OverflowError) as e:
+            # Malformed packet; one log line, no traceback formatting and no
+            # stdout writes on the hot parse path.
+            _LOGGER.warning("Dropping unparseable packet %r: %r", packet, e)
 
         return None
 
@@ -111,6 +126,10 @@ class Frame:
         event (any): Additional event information for advanced use cases.
     """
 
+    # One Frame per incoming event report; slots avoid a per-instance dict
+    __slots__ = ('command', 'function', 'group_address', 'payload', 'state',
+                 'doip_component', 'event')
+
     def __init__(self, command=None, function=None, group_address=None, payload=None, state=None, doip_component=None):
         """Initialize the Frame object.
 
@@ -130,6 +149,10 @@ class Frame:
         self.doip_component = doip_component
         self.event = None  # Optional field for additional event data
 
+    async def dispatch(self, queue):
+        """Route this inbound frame into the incoming processor of the telegram queue."""
+        await queue.process_telegram_incoming(self)
+
     def __str__(self):
         """Return a readable string representation of the Frame object.
 
@@ -17,16 +17,20 @@ Enums:
     - TelegramSetting: Possible settings for functions (e.g., ON, OFF).
 """
 
-from enum import Enum
+import logging
+from enum import IntEnum
+from functools import lru_cache
 from teletask.exceptions import CouldNotParseTeletaskCommand
 
-class TeletaskConst(Enum):
+_LOGGER = logging.getLogger('teletask.telegram')
+
+class TeletaskConst(IntEnum):
     """Enum class for basic Teletask constants."""
     START = 2
     CENTRAL = 1
 
 
-class TelegramCommand(Enum):
+class TelegramCommand(IntEnum):
     """Enum class for Teletask command types."""
     SET = 7             # This command allows the CCT to set individual functions
     GET = 6             # When the TDS receives this command it reports the state of the specified device.
@@ -37,7 +41,7 @@ class TelegramCommand(Enum):
     KEEPALIVE = 11      # This command can be send to keep the socket open.
 
 
-class TelegramFunction(Enum):
+class TelegramFunction(IntEnum):
     """Enum class representing Teletask functional units."""
     RELAY = 1       # control or get the status of a relay
     DIMMER = 2      # control or get the status of a dimmer
@@ -56,13 +60,180 @@ class TelegramFunction(Enum):
     CONDITION = 60  # get the status of a Condition
 
 
-class TelegramSetting(Enum):
+class TelegramSetting(IntEnum):
     """Enum class representing possible settings for Teletask units."""
     ON = 255
     TOGGLE = 103
     OFF = 0
 
 
+_CENTRAL = TeletaskConst.CENTRAL.value  # Numeric central address for payloads
+
+
+def _build_log(telegram, function, address, setting):
+    """Populate the payload of a LOG telegram (minimal payload)."""
+    if setting is not None:
+        raise CouldNotParseTeletaskCommand("LOG telegrams carry no setting")
+    fnc = int(function)
+    telegram.payload = [fnc, 1]  # Fnc, State
+    telegram._payload_sum = fnc + 1
+
+
+def _build_get(telegram, function, address, setting):
+    """Populate the payload of a GET telegram."""
+    if setting is not None:
+        raise CouldNotParseTeletaskCommand("GET telegrams carry no setting")
+    fnc = int(function)
+    telegram.payload = [_CENTRAL, fnc, 0, address]  # Central address = 1
+    telegram._payload_sum = _CENTRAL + fnc + address
+
+
+def _build_set(telegram, function, address, setting):
+    """Populate the payload of a SET telegram; each slot is written exactly once."""
+    fnc = int(function) if function else None
+    if setting is not None:
+        telegram.payload = [_CENTRAL, fnc, 0, address, setting.value]
+        telegram._payload_sum = _CENTRAL + (fnc or 0) + address + setting.value
+    else:
+        telegram.payload = [_CENTRAL, fnc]  # Central address = 1
+        telegram._payload_sum = _CENTRAL + (fnc or 0)
+
+
+# Enum-identity dispatch table; one hash lookup replaces the per-construction
+# str(command) build and string compares.
+_BUILDERS = {
+    TelegramCommand.LOG: _build_log,
+    TelegramCommand.GET: _build_get,
+    TelegramCommand.SET: _build_set,
+}
+
+
+# DoIP values are single bytes; pre-encoding every possible digit string once
+# turns per-value int->str allocations into indexed loads.
+_DIGITS = tuple(str(i).encode('ascii') for i in range(256))
+
+
+class _RawSetting:
+    """Minimal setting wrapper for the out-of-range fallback path."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def build_set(function, address, setting):
+    """Build the final wire bytes of a SET telegram from three ints.
+
+    Specialized flat path for the hot send case: no Telegram instance, no
+    payload list, no per-field formatting — just a constant-folded checksum
+    and a concatenation of pre-encoded byte strings.
+
+    Args:
+        function (int): The functional unit value (e.g. RELAY = 1).
+        address (int): The group address of the unit.
+        setting (int): The setting byte (e.g. ON = 255).
+
+    Returns:
+        bytes: The ASCII-encoded SET telegram.
+    """
+    if not (0 <= address <= 255 and 0 <= setting <= 255):
+        # Out-of-byte-range fields; the generic path has the str() fallback
+        return Telegram(command=TelegramCommand.SET, function=function,
+                        address=address, setting=_RawSetting(setting)).to_bytes()
+    # start(2) + length(8) + command(7) + central(1) = 18
+    checksum = (18 + function + address + setting) & 0xFF
+    return (b's,8,7,1,' + _DIGITS[function] + b',0,' + _DIGITS[address]
+            + b',' + _DIGITS[setting] + b',' + _DIGITS[checksum] + b',')
+
+
+def build_get(function, address):
+    """Build the final wire bytes of a GET telegram from two ints.
+
+    Args:
+        function (int): The functional unit value (e.g. RELAY = 1).
+        address (int): The group address of the unit.
+
+    Returns:
+        bytes: The ASCII-encoded GET telegram.
+    """
+    if not 0 <= address <= 255:
+        # Out-of-byte-range address; the generic path has the str() fallback
+        return Telegram(command=TelegramCommand.GET, function=function,
+                        address=address).to_bytes()
+    # start(2) + length(7) + command(6) + central(1) = 16
+    checksum = (16 + function + address) & 0xFF
+    return (b's,7,6,1,' + _DIGITS[function] + b',0,' + _DIGITS[address]
+            + b',' + _DIGITS[checksum] + b',')
+
+
+@lru_cache(maxsize=None)
+def emitter_for(command, function):
+    """Return a specialized wire-bytes emitter for a (command, function) pair.
+
+    Real installations cycle through a handful of command/function shapes,
+    so the constant parts of the frame — the header, the function digits and
+    the fixed portion of the checksum — are folded into a closure once per
+    shape. The emitter then only formats the per-call bytes.
+
+    Args:
+        command (int): The command value (SET or GET).
+        function (int): The functional unit value (e.g. RELAY = 1).
+
+    Returns:
+        callable or None: An emitter taking (address, setting) for SET or
+        (address,) for GET, or None for shapes without a flat template.
+    """
+    if command == TelegramCommand.SET:
+        prefix = b's,8,7,1,' + _DIGITS[function] + b',0,'
+        base = 18 + function  # start(2) + length(8) + command(7) + central(1) + function
+
+        def emit_set(address, setting):
+            if not (0 <= address <= 255 and 0 <= setting <= 255):
+                return build_set(function, address, setting)  # Out-of-range fallback
+            checksum = (base + address + setting) & 0xFF
+            return (prefix + _DIGITS[address] + b',' + _DIGITS[setting]
+                    + b',' + _DIGITS[checksum] + b',')
+        return emit_set
+    if command == TelegramCommand.GET:
+        prefix = b's,7,6,1,' + _DIGITS[function] + b',0,'
+        base = 16 + function  # start(2) + length(7) + command(6) + central(1) + function
+
+        def emit_get(address):
+            if not 0 <= address <= 255:
+                return build_get(function, address)  # Out-of-range fallback
+            checksum = (base + address) & 0xFF
+            return prefix + _DIGITS[address] + b',' + _DIGITS[checksum] + b','
+        return emit_get
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _build_cached(command, function, address, setting):
+    """Return the wire bytes for an outbound telegram, memoized per 4-tuple.
+
+    Bus traffic is highly repetitive (the same SET RELAY x ON recurs
+    constantly), so after the first build a telegram costs one dict lookup.
+    Cache misses go through the shape-specialized emitters where one exists.
+    """
+    if command == TelegramCommand.SET and setting is not None:
+        return emitter_for(command, function)(address, setting)
+    if command == TelegramCommand.GET:
+        return emitter_for(command, function)(address)
+    telegram = Telegram(
+        command=TelegramCommand(command),
+        function=TelegramFunction(function) if function is not None else None,
+        address=address,
+        setting=TelegramSetting(setting) if setting is not None else None)
+    return telegram.to_bytes()
+
+
+# The keep-alive wire form is a compile-time constant; build it (and its
+# encoded form for socket writes) once at import instead of per beat.
+_HEARTBEAT_STR = f"s,3,{TelegramCommand.KEEPALIVE.value},{(2 + 3 + 11) % 256},"
+_HEARTBEAT_BYTES = _HEARTBEAT_STR.encode()
+
+
 class Telegram:
     """Class representing a Teletask DoIP telegram.
 
@@ -74,10 +245,14 @@ class Telegram:
         start (int): The start value of the telegram (from TeletaskConst.START).
         length (int): The length of the telegram.
         command (TelegramCommand): The telegram's command.
-        payload (dict): The payload data for the telegram.
+        payload (list): The payload data for the telegram.
         checksum (int): The checksum value of the telegram.
     """
 
+    # Telegrams are created per send on hot paths; slots drop the instance dict
+    __slots__ = ('start', 'length', 'command', 'payload', 'checksum', '_payload_sum',
+                 '_encoded')
+
     def __init__(self, command=None, function=None, address=None, setting=None):
         """Initialize the Telegram instance.
 
@@ -90,78 +265,118 @@ class Telegram:
         self.start = TeletaskConst.START.value  # Start value from TeletaskConst
         self.length = 0  # Default length before calculation
         self.command = None  # Will be assigned a command value later
-        self.payload = {}  # Dictionary to hold payload data
-
-        # Logic for different command types
-        if str(command) == "TelegramCommand.LOG":
-            # Handle 'LOG' command (minimal payload)
-            self.payload[0] = function.value #Fnc
-            self.payload[1] = 1 # State
-        elif str(command) == "TelegramCommand.GET":
-            # Handle 'GET' command with additional parameters
-            self.payload[0] = TeletaskConst.CENTRAL # Central address = 1
-            self.payload[1] = function.value
-            self.payload[2] = 0
-            self.payload[3] = address
-        elif str(command) == "TelegramCommand.SET":
-            # Handle 'SET' command
-            self.payload[0] = TeletaskConst.CENTRAL # Central address = 1 
-            self.payload[1] = function.value if function else None
-        else:
+
+        # Build the payload (setting included) for the command type via the
+        # dispatch table; every slot is written exactly once
+        try:
+            builder = _BUILDERS[command]
+        except KeyError:
             # Raise an exception if the command is unrecognized
             raise CouldNotParseTeletaskCommand
+        builder(self, function, address, setting)
 
-        # Assign the command's value to the instance
+        # Assign the command as a plain int to the instance
         if command is not None:
-            self.command = command.value
-
-        # If a setting is provided, add it to the payload
-        if setting is not None:
-            self.payload[2] = 0  # Reserved value
-            self.payload[3] = address
-            self.payload[4] = setting.value
+            self.command = int(command)
 
         self.checksum = 0  # Initialize checksum
+        self._encoded = None  # Wire bytes, memoized on first to_bytes()
 
-    def to_teletask(self):
-        """Generate the string representation of the telegram.
+    async def dispatch(self, queue):
+        """Route this outbound telegram into the outgoing processor of the telegram queue.
 
-        This method calls the `__str__` method and prints the telegram.
+        Telegrams built in this module are always commands for the central
+        unit; inbound traffic arrives as Frame objects, which route to the
+        incoming processor instead.
         """
-        print(str(self))
+        await queue.process_telegram_outgoing(self)
+
+    def to_teletask(self):
+        """Generate the string representation of the telegram."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Telegram: %s", self)
         return str(self)
 
+    def to_bytes(self):
+        """Generate the wire form of the telegram as bytes.
+
+        All fields are single bytes, so the frame is assembled from the
+        pre-encoded digit table without any int->str formatting.
+
+        Returns:
+            bytes: The ASCII-encoded telegram, ready for the socket.
+        """
+        if self._encoded is not None:
+            return self._encoded  # Re-sent telegram; reuse the memoized bytes
+        self.calc_length()  # Calculate length
+        self.calc_checksum()  # Calculate checksum
+        try:
+            parts = [b's', _DIGITS[self.length], _DIGITS[self.command]]
+            for value in self.payload:
+                if value < 0:
+                    raise IndexError  # Negative values would index from the end
+                parts.append(_DIGITS[value])
+            parts.append(_DIGITS[self.checksum])
+            parts.append(b'')  # Trailing comma
+            encoded = b','.join(parts)
+        except (IndexError, TypeError):
+            # Out-of-byte-range or unset fields; fall back to the generic path
+            encoded = str(self).encode('ascii')
+        self._encoded = encoded
+        return encoded
+
     def __str__(self):
         """Generate a readable string for the telegram."""
         self.calc_length()  # Calculate length
         self.calc_checksum()  # Calculate checksum
 
         # Format the payload as a comma-separated string
-        payload_str = ','.join(("{!s}".format(val) for (key, val) in self.payload.items()))
-        message = "s,{0},{1},{2},{3},".format(self.length, self.command, payload_str, self.checksum)
-        return message
+        payload_str = ','.join(map(str, self.payload))
+        return f"s,{self.length},{self.command},{payload_str},{self.checksum},"
 
     def __eq__(self, other):
         """Override equality operator to compare telegrams based on attributes."""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Telegram):
+            return NotImplemented
+        return (self.start, self.length, self.command, self.payload, self.checksum) \
+            == (other.start, other.length, other.command, other.payload, other.checksum)
+
+    @classmethod
+    def for_send(cls, command, function=None, address=None, setting=None):
+        """Return the cached wire bytes for an outbound telegram.
+
+        Canonical constructor for the send path: repeated telegrams resolve
+        to the same interned bytes object instead of being rebuilt.
+
+        Args:
+            command (TelegramCommand): The command type (SET, GET, ...).
+            function (TelegramFunction, optional): The functional unit.
+            address (int, optional): The group address.
+            setting (int, optional): The setting byte for SET commands.
+
+        Returns:
+            bytes: The ASCII-encoded telegram.
+        """
+        return _build_cached(
+            int(command),
+            int(function) if function is not None else None,
+            address,
+            int(setting) if setting is not None else None)
 
     def calc_length(self):
         """Calculate the length of the telegram based on its payload."""
-        try:
-            self.length = len(self.payload) + 3  # 3 additional fields: start, command, checksum
-        except Exception:
-            # Default length if something goes wrong
-            self.length = 8
+        self.length = len(self.payload) + 3  # 3 additional fields: start, command, checksum
 
     def calc_checksum(self):
         """Calculate the checksum for the telegram.
 
-        The checksum is the sum of the payload values, start, length, and command,
-        modulo 256.
+        The DoIP checksum is a plain additive sum of all frame bytes modulo
+        256 — not a CRC — so no lookup table or polynomial folding applies.
+        The payload sum is maintained while the payload is built, so this
+        folds in the header fields and masks to a byte without ever looping
+        over the payload.
         """
-        packet_sum = sum(self.payload.values())  # Sum all payload values
-        packet_sum += self.start + self.length + self.command  # Add start, length, and command
-        self.checksum = packet_sum % 256  # Modulo 256
+        self.checksum = (self._payload_sum + self.start + self.length + self.command) & 0xFF
 
 
 class TelegramHeartbeat:
@@ -174,15 +389,24 @@ class TelegramHeartbeat:
         content (TelegramCommand): The keep-alive command.
     """
 
+    __slots__ = ('content',)
+
     def __init__(self):
         """Initialize the TelegramHeartbeat class."""
         self.content = TelegramCommand.KEEPALIVE  # Set command to KEEPALIVE
 
+    async def dispatch(self, queue):
+        """Route this heartbeat into the outgoing processor of the telegram queue."""
+        await queue.process_telegram_outgoing(self)
+
     def to_teletask(self):
         """Generate the string representation of the heartbeat telegram."""
-        return str(self)
+        return _HEARTBEAT_STR
+
+    def to_bytes(self):
+        """Generate the wire form of the heartbeat telegram as bytes."""
+        return _HEARTBEAT_BYTES
 
     def __str__(self):
         """Generate a readable string for the heartbeat telegram."""
-        message = "s,3,{0},{1},".format(TelegramCommand.KEEPALIVE.value, (2 + 3 + 11) % 256)
-        return message
+        return _HEARTBEAT_STR
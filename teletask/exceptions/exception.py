@@ -24,12 +24,14 @@ class TeletaskException(Exception):
     """
 
     def __eq__(self, other):
-        """Override equality operator to compare based on attributes."""
-        return self.__dict__ == other.__dict__
+        """Override equality operator to compare type, args and description."""
+        return type(self) is type(other) \
+            and self.args == other.args \
+            and getattr(self, 'description', None) == getattr(other, 'description', None)
 
-    def __hash__(self):
-        """Override hash function to ensure consistent hash value."""
-        return 0
+    # Inherit object's id-based __hash__; a constant hash would pile every
+    # exception into the same bucket of any set or dict holding them.
+    __hash__ = Exception.__hash__
 
 
 class CouldNotParseTelegram(TeletaskException):
@@ -50,6 +52,10 @@ class CouldNotParseTelegram(TeletaskException):
         super(CouldNotParseTelegram, self).__init__("Could not parse Telegram")
         self.description = description
         self.parameter = kwargs
+        # Exceptions are immutable in practice; format the message once here
+        # instead of re-sorting the parameters every time it is logged.
+        self._cached_str = '<CouldNotParseTelegram description="{0}" {1}/>' \
+            .format(description, self._format_parameter())
 
     def _format_parameter(self):
         """Format the parameters as a string for easier readability."""
@@ -57,8 +63,7 @@ class CouldNotParseTelegram(TeletaskException):
 
     def __str__(self):
         """Return a string representation of the exception."""
-        return '<CouldNotParseTelegram description="{0}" {1}/>' \
-            .format(self.description, self._format_parameter())
+        return self._cached_str
 
 
 class CouldNotParseTeletaskCommand(TeletaskException):
@@ -116,6 +121,9 @@ class ConversionError(TeletaskException):
         super(ConversionError, self).__init__("Conversion Error")
         self.description = description
         self.parameter = kwargs
+        # Format once at construction; str() just returns the cached message.
+        self._cached_str = '<ConversionError description="{0}" {1}/>'.format(
+            description, self._format_parameter())
 
     def _format_parameter(self):
         """Format the parameters as a string for easier readability."""
@@ -123,7 +131,7 @@ class ConversionError(TeletaskException):
 
     def __str__(self):
         """Return a string representation of the exception."""
-        return '<ConversionError description="{0}" {1}/>'.format(self.description, self._format_parameter())
+        return self._cached_str
 
 
 class CouldNotParseAddress(TeletaskException):
@@ -4,12 +4,12 @@ The module is build upon asyncio udp functions.
 Due to lame support of UDP multicast within asyncio some special treatment for multicast is necessary.
 """
 import asyncio
+import logging
 import socket
-import binascii
-import time
+import weakref
 
-#from teletask.exceptions import CouldNotParseTeletaskIP, XTeletaskException
-from teletask.doip import Frame, FrameQueue
+from teletask.exceptions import TeletaskException
+from teletask.doip import Frame, FrameQueue, TelegramHeartbeat
 
 
 class Client:
@@ -17,9 +17,14 @@ class Client:
 
     # pylint: disable=too-few-public-methods
 
+    FLUSH_THRESHOLD = 1400  # Flush early once the buffer fills roughly one MTU-sized segment
+
     class Callback:
         """Callback class for handling callbacks for different 'service types' of received packets."""
 
+        # One instance per registered listener; slots avoid a per-instance dict.
+        __slots__ = ('callback', 'service_types')
+
         def __init__(self, callback, service_types=None):
             """Initialize Callback class.
             
@@ -28,53 +33,62 @@ class Client:
                 service_types: A list of service types that this callback should listen for.
             """
             self.callback = callback
-            self.service_types = service_types or []  # Initialize with an empty list if None provided.
+            # None means "listen to everything"; a frozenset gives O(1)
+            # membership checks for callbacks that do filter.
+            self.service_types = frozenset(service_types) if service_types else None
 
 
         def has_service(self, service_type):
             """Test if callback is listening for the given service type.
-            
+
             Args:
                 service_type: The type of service to check against.
-            
+
             Returns:
                 bool: True if the callback is listening for the service type, False otherwise.
             """
-            return len(self.service_types) == 0 or service_type in self.service_types
+            return self.service_types is None or service_type in self.service_types
 
     class ClientFactory(asyncio.Protocol):
-        """Abstraction for managing the asyncio-tcp transports."""
+        """Abstraction for managing the asyncio-tcp transports.
 
-        def __init__(self, host, port, data_received_callback=None, teletask=None):
+        Holds the owning Client only by weak reference; connection state
+        (host, port, callbacks) lives on the Client itself, so a reconnect
+        reuses this instance and only the transport changes.
+        """
+
+        # Attribute access goes through C-level slot descriptors instead of
+        # the instance dict.
+        __slots__ = ('_client', 'teletask', '_logger', 'transport')
+
+        def __init__(self, client, teletask=None):
             """Initialize ClientFactory class.
-            
+
             Args:
-                host: The host address for the TCP connection.
-                port: The port for the TCP connection.
-                data_received_callback: Callback to call when data is received.
+                client: The owning Client instance (held weakly).
                 teletask: Reference to the Teletask instance for logging and other functionalities.
             """
-            self.host = host
-            self.port = port
-            self.data_received_callback = data_received_callback  # Callback for received data.
+            self._client = weakref.ref(client)  # Weak back-reference, no cycle with the Client.
             self.teletask = teletask  # Reference to the Teletask instance.
+            self._logger = teletask.logger if teletask else None  # Bound once; no hasattr probing per event.
 
         def connection_made(self, transport):
             """Assign transport. Callback after TCP connection is made.
-            
+
             Args:
                 transport: The transport object representing the TCP connection.
             """
             self.transport = transport  # Save the transport object for later use.
 
         def data_received(self, data):
-            """Call assigned callback. Callback for datagram received.
-            
+            """Delegate to the owning Client. Callback for datagram received.
+
             Args:
                 data: The data received over the TCP connection.
             """
-            if self.data_received_callback is not None:
-                self.data_received_callback(data)  # Call the callback with the received data.
+            client = self._client()
+            if client is not None:
+                client.data_received_callback(data)  # Hand the data to the Client.
 
         def error_received(self, exc):
             """Handle errors. Callback for error received.
@@ -82,8 +96,8 @@ class Client:
             Args:
                 exc: The exception that occurred.
             """
-            if hasattr(self, 'teletask'):
-                self.teletask.logger.warning('Error received: %s', exc)  # Log the error.
+            if self._logger is not None:
+                self._logger.warning('Error received: %s', exc)  # Log the error.
 
         def connection_lost(self, exc):
             """Log error. Callback for connection lost.
@@ -91,8 +105,8 @@ class Client:
             Args:
                 exc: The exception or error associated with the lost connection.
             """
-            if hasattr(self, 'teletask'):
-                self.teletask.logger.info('Closing transport %s', exc)  # Log the closure of the transport.
+            if self._logger is not None:
+                self._logger.info('Closing transport %s', exc)  # Log the closure of the transport.
         
         
         def send(self, msg):
@@ -116,7 +130,25 @@ class Client:
         self.host = host  # Host address for the TCP connection.
         self.port = port  # Port for the TCP connection.
         self.callbacks = []  # List to store registered callbacks for received packets.
+        self._callbacks_snapshot = ()  # Raw callables, rebuilt on (un)register for hot dispatch.
+        self._send_buf = []  # Encoded frames awaiting the next coalesced flush.
+        self._send_bytes = 0  # Byte count of the buffered frames.
+        self._flush_handle = None  # call_soon handle for the pending flush, if any.
+        self._frame_queue = FrameQueue()  # Reused across packets instead of one per read.
+        self._rx_buf = bytearray()  # Accumulates reads so frames spanning TCP packets survive.
+        self._factory = None  # Protocol factory, created once and reused across reconnects.
+        self._bad_frames = 0  # Count of reads that failed to parse; logged rate-limited.
+        self._log = teletask.logger  # Bound once; the hot paths skip the attribute chain.
+        # Cached level flags: a disabled per-frame info/debug call must cost a
+        # single truth test, not a LogRecord plus a Frame repr.
+        self._log_info = self._log.isEnabledFor(logging.INFO)
+        self._log_debug = self._log.isEnabledFor(logging.DEBUG)
+
 
+    def reset_log_level(self):
+        """Refresh the cached level flags after the application changes log levels."""
+        self._log_info = self._log.isEnabledFor(logging.INFO)
+        self._log_debug = self._log.isEnabledFor(logging.DEBUG)
 
     def data_received_callback(self, raw):
         """Parse and process Teletask frame. Callback for having received a TCP packet.
@@ -126,14 +158,52 @@ class Client:
         """
         if raw:
             try:
-                frame_queue = FrameQueue()  # Create a FrameQueue instance to handle frames.
-                frames = frame_queue.process_frames(raw)  # Process raw data into frames.
+                rx_buf = self._rx_buf
+                rx_buf.extend(raw)  # A frame may arrive split across reads.
+                if len(rx_buf) < 9:
+                    return  # Not even one complete frame yet; wait for more data.
+                # Parse over a memoryview so frame extraction slices the buffer
+                # without copying it per frame.
+                view = memoryview(rx_buf)
+                try:
+                    frames = list(self._frame_queue.process_frames(view))
+                finally:
+                    view.release()  # The buffer cannot be trimmed while a view is live.
+                self._trim_rx_buf()
+
+                # Hoist the per-frame lookups out of the loop; a busy read can
+                # carry dozens of frames and each LOAD_ATTR adds up.
+                log_info = self._log.info if self._log_info else None
+                handle = self.handle_teletaskframe
                 for frame in frames:
-                    self.teletask.logger.info("Received: %s", frame)  # Log the received frame.
-                    self.handle_teletaskframe(frame)  # Handle the received frame.
+                    if log_info is not None:
+                        log_info("Received: %s", frame)  # Log the received frame.
+                    handle(frame)  # Handle the received frame.
 
-            except Exception as ex:
-                self.teletask.logger.exception(ex)  # Log any exception that occurs.
+            except (ValueError, TypeError, IndexError, TeletaskException) as ex:
+                # Malformed input from the peer; a traceback per junk packet
+                # would be DoS-grade, so count and log every 256th occurrence.
+                self._bad_frames += 1
+                if self._bad_frames & 0xFF == 1:
+                    self._log.warning("Bad frames received: %d, last error: %r", self._bad_frames, ex)
+
+    def _trim_rx_buf(self):
+        """Discard consumed receive bytes, keeping any trailing partial frame.
+
+        Only the last 8 bytes can hold the start of an incomplete frame; keep
+        from the first position there that still matches the 2,9,16 signature
+        prefix and drop everything before it in place.
+        """
+        rx_buf = self._rx_buf
+        length = len(rx_buf)
+        keep = length
+        for i in range(max(0, length - 8), length):
+            if rx_buf[i] == 2 \
+                    and (i + 1 >= length or rx_buf[i + 1] == 9) \
+                    and (i + 2 >= length or rx_buf[i + 2] == 16):
+                keep = i
+                break
+        del rx_buf[:keep]  # In-place trim, no reallocation of the tail
 
     def handle_teletaskframe(self, frame):
         """Handle Frame and call all callbacks that watch for the service type identifier.
@@ -141,13 +211,17 @@ class Client:
         Args:
             frame: The Teletask frame to handle.
         """
-        handled = False
-        for callback in self.callbacks:
-            callback.callback(frame, self)  # Call the callback with the frame and the client instance.
-            handled = True  # Mark that a callback was handled.
-
-        if not handled:
-            self.teletask.logger.debug("UNHANDLED: %s", frame)  # Log if no callback handled the frame.
+        callbacks = self._callbacks_snapshot  # Immutable snapshot; safe against mid-dispatch (un)register.
+        if not callbacks:
+            if self._log_debug:
+                self._log.debug("UNHANDLED: %s", frame)  # Log if no callback handled the frame.
+            return
+        for callback in callbacks:
+            try:
+                callback(frame, self)  # Call the callback with the frame and the client instance.
+            except Exception as ex:
+                # One failing listener must not starve the others of the frame.
+                self._log.warning("Error in frame callback: %s", ex)
 
     def register_callback(self, callback):
         """Register a callback for handling received packets.
@@ -160,6 +234,7 @@ class Client:
         """
         callb = Client.Callback(callback)  # Create a new Callback instance.
         self.callbacks.append(callb)  # Add it to the list of callbacks.
+        self._callbacks_snapshot = tuple(cb.callback for cb in self.callbacks)
         return callb
 
     def unregister_callback(self, callb):
@@ -169,21 +244,19 @@ class Client:
             callb: The Callback instance to unregister.
         """
         self.callbacks.remove(callb)  # Remove the callback from the list.
+        self._callbacks_snapshot = tuple(cb.callback for cb in self.callbacks)
 
     async def connect(self):
         """Connect to the TCP socket. Open UDP port and build multicast socket if necessary."""
-        client_factory = Client.ClientFactory(
-            host=self.host, 
-            port=self.port, 
-            data_received_callback=self.data_received_callback, 
-            teletask=self.teletask
-        )
-        
+        # The factory survives reconnects; only the transport is renewed.
+        if self._factory is None:
+            self._factory = Client.ClientFactory(client=self, teletask=self.teletask)
+
         # old code: (reader, writer) = await self.teletask.loop.create_connection(
 
         # Connect using asyncio create_connection for protocols
         transport, protocol = await self.teletask.loop.create_connection(
-            lambda: client_factory,
+            lambda: self._factory,
             host=self.host,
             port=self.port
         )
@@ -192,25 +265,87 @@ class Client:
         # old code: self.writer = writer  # Save the writer object.
         self.writer = protocol  # Set writer (which contains transport)
         self.reader = transport  # Set reader (the transport itself)
+
+        # Size the kernel buffers up front so telegram bursts are absorbed
+        # without stalling the write path, and disable Nagle: frames are tiny
+        # and already coalesced in user space, so delaying them only adds latency.
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         
 
     async def send_telegram(self, frame):
         """Send a telegram frame.
-        
+
         Args:
             frame: The telegram frame to send.
         """
         self.send(frame)  # Send the frame using the send method.
 
+    async def send_telegrams(self, frames):
+        """Send multiple telegram frames as a single socket write.
+
+        Args:
+            frames: The telegram frames to send.
+        """
+        buffers = [frame if isinstance(frame, (bytes, bytearray))
+                   else frame.to_bytes() for frame in frames]
+        if self._log_info:
+            self._log.info("Sending batch of %d frames", len(frames))
+        self._send_buf.extend(buffers)  # Keep ordering with already-buffered frames.
+        self._flush()  # One writelines call for the whole batch.
+
     def send(self, frame):
-        """Send Frame to socket.
-        
+        """Queue a frame for sending.
+
+        Frames are buffered and flushed with a single writelines() call at the
+        end of the current event-loop iteration, so a burst of sends costs one
+        syscall instead of one per frame.
+
+        Args:
+            frame: The frame to send.
+        """
+        if isinstance(frame, TelegramHeartbeat):
+            buffer = frame.to_bytes()  # Pre-encoded in the doip layer; skip logging too.
+        elif isinstance(frame, (bytes, bytearray)):
+            buffer = frame  # Pre-serialized frame, write as-is.
+        else:
+            if self._log_info:
+                self._log.info("Sending: %s", frame)  # Log the frame being sent.
+            buffer = frame.to_bytes()  # Serialize straight to bytes.
+        self._send_buf.append(buffer)
+        self._send_bytes += len(buffer)
+        if self._send_bytes > self.FLUSH_THRESHOLD:
+            self._flush()  # A full segment's worth is buffered; ship it now.
+        elif self._flush_handle is None:
+            self._flush_handle = self.teletask.loop.call_soon(self._flush)
+
+    def _flush(self):
+        """Write all buffered frames in a single transport call."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()  # A direct flush supersedes the scheduled one.
+            self._flush_handle = None
+        if not self._send_buf:
+            return
+        buffers, self._send_buf = self._send_buf, []
+        self._send_bytes = 0
+        self.writer.transport.writelines(buffers)  # Coalesced into one syscall where possible.
+
+    def send_nodelay(self, frame):
+        """Send a frame immediately, bypassing the coalescing buffer.
+
+        Escape hatch for latency-sensitive traffic; flushes anything already
+        buffered first so frames stay ordered on the wire.
+
         Args:
             frame: The frame to send.
         """
-        self.teletask.logger.info("Sending: %s", frame)  # Log the frame being sent.
-        self.writer.send(frame.to_teletask().encode())  # Encode the frame and send it.
-        #time.sleep(0.2)
+        self._flush()
+        if not isinstance(frame, (bytes, bytearray)):
+            frame = frame.to_bytes()
+        self.writer.send(frame)
 
     async def stop(self):
         """Stop the TCP socket."""
@@ -219,6 +354,7 @@ class Client:
         
         # Close the transport if available
         if self.writer and hasattr(self.writer, 'transport'):
+            self._flush()  # Drain any frames still waiting for the coalesced write.
             self.writer.transport.close()  # Correct way to close the transport
 
         if self.reader:
@@ -4,6 +4,7 @@ TeletaskDoIPInterface manages Teletask/DoIP connections.
 * It passes Teletask telegrams from the network and
 * provides callbacks after having received a telegram from the network.
 """
+import asyncio
 from enum import Enum
 from platform import system as get_os_name
 
@@ -64,15 +65,39 @@ class TeletaskDoIPInterface():
             await self.interface.stop()  # Stop the client connection
             self.interface = None  # Clear the interface reference
 
+    def write_buffer_empty(self):
+        """Return True if the underlying transport is connected and idle."""
+        client = getattr(self, "interface", None)
+        writer = getattr(client, "writer", None)
+        transport = getattr(writer, "transport", None)
+        return transport is not None and transport.get_write_buffer_size() == 0
+
+    def send_immediate(self, telegram):
+        """Synchronously write a telegram, bypassing the telegram queue.
+
+        Only valid when the transport is idle (see write_buffer_empty); used
+        as a fast path to skip the queue round-trip for single telegrams.
+
+        Args:
+            telegram: The telegram to write.
+        """
+        self.interface.send(telegram)
+
     def telegram_received(self, telegram):
         """Put received telegram into queue. Callback for having received telegram.
-        
+
         This method adds the received telegram to the event loop queue for further processing.
-        
+        The enqueue is synchronous (put_nowait) instead of a Task per frame;
+        Task creation is far heavier than the queue insert it wrapped.
+
         Args:
             telegram: The telegram received from the network.
         """
-        self.teletask.loop.create_task(self.teletask.telegrams.put(telegram))
+        try:
+            self.teletask.telegrams.put_nowait(telegram)
+        except asyncio.QueueFull:
+            # Only possible with a bounded queue; fall back to the awaited put
+            self.teletask.loop.create_task(self.teletask.telegrams.put(telegram))
 
     async def send_telegram(self, telegram):
         """Send telegram to connected device.
@@ -82,4 +107,15 @@ class TeletaskDoIPInterface():
         Args:
             telegram: The telegram to be sent.
         """
-        await self.interface.send_telegram(telegram)  # Use the client to send the telegram
\ No newline at end of file
+        await self.interface.send_telegram(telegram)  # Use the client to send the telegram
+
+    async def send_telegrams(self, telegrams):
+        """Send several telegrams to the connected device in one socket write.
+
+        Args:
+            telegrams: A list of telegrams to be sent as a single batch.
+        """
+        if len(telegrams) == 1:
+            await self.interface.send_telegram(telegrams[0])  # Single telegram, no batching needed
+        else:
+            await self.interface.send_telegrams(telegrams)  # Batch into one write
\ No newline at end of file
@@ -2,12 +2,12 @@
 import asyncio  # For handling asynchronous operations
 import random   # To generate random brightness levels
 import logging  # To configure logging
-from enum import Enum
+from enum import IntEnum
 from teletask import Teletask  # Import the Teletask protocol handler in client.py
 from teletask.devices import Light  # Import the Light class for controlling lights
 from teletask.devices import Dimmer  # Import the Dimmer class for controlling dimmable lights
 
-class HomeRelays(Enum):
+class HomeRelays(IntEnum):
     """Enum class with list of my relays."""
     OVERLOOP_WAND = 1                # 2nd floor - Hall - Lights wall
     OVERLOOP_BUREAU = 14             # 2nd floor - Hall - Light desk
@@ -124,7 +124,8 @@ async def main(ip_address, port):
 ip_address = "192.168.1.22"  # You can change this to any IP address you want to use
 port = 55957  # You can change this to any port you want to use
 
-# Get the event loop and run the main function until it completes, passing the IP and port as arguments
-loop = asyncio.get_event_loop()
-loop.run_until_complete(main(ip_address, port))  # Pass the IP address and port to the main function
-loop.close()  # Close the event loop
+# Run the main function, passing the IP and port as arguments. asyncio.run
+# creates and closes the loop itself; the __main__ guard keeps imports of this
+# module from spawning an event loop.
+if __name__ == "__main__":
+    asyncio.run(main(ip_address, port))